@@ -1,200 +1,676 @@
 # Imports / Dependencies
+import ctypes                       # Native kernel loading
+import itertools                    # Frame striding
+import math                         # Scalar math
+import os                           # Native kernel path
 import numpy as np                  # Numerical utilities
-import matplotlib.pyplot as plt     # Plotting
-from typing import Tuple            # Typing
+from matplotlib import colormaps    # Heatmap colors
+from typing import Iterator, List, Optional, Tuple  # Typing
+
+# Optional JIT compilation -- without numba the kernels below simply run as plain Python
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba isn't available: returns the function untouched."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Optional native checkerboard kernel, built from ising_kernel.c next to this file
+try:
+    _native_kernel = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ising_kernel.so"))
+    _native_kernel.sweep_checkerboard.argtypes = [
+        np.ctypeslib.ndpointer(dtype=np.int8, ndim=2, flags="C_CONTIGUOUS"),
+        ctypes.c_int,
+        ctypes.c_int,
+        np.ctypeslib.ndpointer(dtype=np.uint32, flags="C_CONTIGUOUS"),
+        np.ctypeslib.ndpointer(dtype=np.uint32, ndim=2, flags="C_CONTIGUOUS"),
+    ]
+    _native_kernel.sweep_checkerboard.restype = None
+except OSError:
+    _native_kernel = None
+
+
+@njit(cache=True)
+def _metropolis_steps(spins: np.ndarray, vertical_bonds: bool, coupling: float, ext_field: float, 
+                      acceptance: np.ndarray, rows_idx: np.ndarray, cols_idx: np.ndarray, 
+                      uniforms: np.ndarray) -> Tuple[float, int]:
+    """Evolves a lattice in place through single-spin Metropolis-Hastings steps.
+
+    The random numbers are drawn beforehand in batches, one step per element of the arrays.
+
+    Args:
+        spins (np.ndarray): the spins lattice as 2D, a 1D chain being a single row, modified in place
+        vertical_bonds (bool): whether spins interact along the columns, False for 1D chains
+        coupling (float): coupling interaction between spins
+        ext_field (float): external magnetic field strength
+        acceptance (np.ndarray): flip acceptance probabilities, see IsingMetal._acceptance_table
+        rows_idx (np.ndarray): row of the spin picked at each step
+        cols_idx (np.ndarray): col of the spin picked at each step
+        uniforms (np.ndarray): uniform [0, 1) draws for each step's acceptance
+
+    Returns:
+        Tuple[float, int]: the total energy change and spins sum change from the accepted flips
+    """
+    rows, cols = spins.shape
+    energy_change = 0.0
+    spin_sum_change = 0
+
+    for step in range(uniforms.shape[0]):
+        # Picks a random spin
+        i = rows_idx[step]
+        j = cols_idx[step]
+        # Note: cast to int so the sums can't overflow int8
+        chosen_spin = int(spins[i, j])
+
+        # Nearest-neighbors sum
+        # Note: the modulo induces a periodic boundary condition
+        nn_sum = spins[i, (j + 1) % cols] + spins[i, (j - 1) % cols]
+        if vertical_bonds:
+            nn_sum += spins[(i + 1) % rows, j] + spins[(i - 1) % rows, j]
+
+        # Computes the energy diff if that spin is flipped
+        dE = 2.0 * coupling * chosen_spin * nn_sum + 2.0 * ext_field * chosen_spin
+
+        # Accepts with a probability proportional to temperature; lower energies have a probability 
+        # of 1 in the table, so a single comparison covers both cases and the flip is branchless
+        accept = uniforms[step] < acceptance[(chosen_spin + 1) // 2, (nn_sum + 4) // 2]
+        spins[i, j] = chosen_spin - 2 * chosen_spin * accept
+        energy_change += dE * accept
+        spin_sum_change -= 2 * chosen_spin * accept
+
+    return energy_change, spin_sum_change
+
+
+@njit(cache=True, parallel=True)
+def _metropolis_chains(spins_stack: np.ndarray, vertical_bonds: bool, coupling: float, ext_field: float, 
+                       acceptance: np.ndarray, rngs: List[np.random.Generator], n_steps: int, 
+                       batch: int) -> None:
+    """Evolves a stack of independent lattices in place, each chain on its own thread.
+
+    Each chain draws its random numbers from its own generator, inside the parallel region.
+
+    Args:
+        spins_stack (np.ndarray): the lattices, with shape (n_chains, rows, cols)
+        vertical_bonds (bool): whether spins interact along the columns, False for 1D chains
+        coupling (float): coupling interaction between spins
+        ext_field (float): external magnetic field strength
+        acceptance (np.ndarray): flip acceptance probabilities, see IsingMetal._acceptance_table
+        rngs (List[np.random.Generator]): one independent random number generator per chain
+        n_steps (int): spin flip attempts per chain
+        batch (int): single spin steps whose random numbers are drawn at once
+    """
+    rows, cols = spins_stack.shape[1], spins_stack.shape[2]
+
+    # Each thread owns its chain and its generator, so no synchronization is needed
+    for chain in prange(spins_stack.shape[0]):
+        rng = rngs[chain]
+        for start in range(0, n_steps, batch):
+            size = min(batch, n_steps - start)
+            rows_idx = rng.integers(0, rows, size=size)
+            cols_idx = rng.integers(0, cols, size=size)
+            uniforms = rng.random(size)
+            _metropolis_steps(spins_stack[chain], vertical_bonds, coupling, ext_field, acceptance, 
+                              rows_idx, cols_idx, uniforms)
+
+
+# Bits per word in the multi-spin coded lattice
+_WORD_BITS = 64
+
+
+def _pack_spins(spins: np.ndarray) -> np.ndarray:
+    """Packs a 2D spin lattice into uint64 words, one bit per spin (1 for spin up).
+
+    Bit b of word w in a row holds the spin at column b * words + w, so horizontal neighbors 
+    sit on the same bit of adjacent words and 64 sites can be updated per word operation.
+
+    Args:
+        spins (np.ndarray): the spins lattice, with a number of columns multiple of 64
+
+    Returns:
+        np.ndarray: packed lattice with shape (rows, cols // 64)
+    """
+    rows, cols = spins.shape
+    words = cols // _WORD_BITS
+    interleaved = (spins > 0).reshape(rows, _WORD_BITS, words).transpose(0, 2, 1)
+    packed = np.packbits(interleaved, axis=-1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8")[..., 0]
+
+
+def _unpack_spins(bits: np.ndarray) -> np.ndarray:
+    """Inverse of _pack_spins, unpacks uint64 words back into a +1 / -1 int8 lattice.
+
+    Args:
+        bits (np.ndarray): packed lattice with shape (rows, words)
+
+    Returns:
+        np.ndarray: the spins lattice with shape (rows, words * 64)
+    """
+    rows, words = bits.shape
+    unpacked = np.unpackbits(bits.astype("<u8").view(np.uint8).reshape(rows, words, 8), axis=-1, bitorder="little")
+    spins = unpacked.transpose(0, 2, 1).reshape(rows, words * _WORD_BITS).astype(np.int8)
+    return 2 * spins - 1
+
+
+def _random_bits(rng: np.random.Generator, prob: float, shape: Tuple[int, ...]) -> np.ndarray:
+    """Draws uint64 words whose bits are independently set with a given probability.
+
+    Args:
+        rng (np.random.Generator): random number generator
+        prob (float): probability of each bit being set
+        shape (Tuple[int, ...]): shape of the words array
+
+    Returns:
+        np.ndarray: the random words
+    """
+    draws = rng.random(shape + (_WORD_BITS,)) < prob
+    return np.packbits(draws, axis=-1, bitorder="little").view("<u8")[..., 0]
+
 
 class IsingMetal:
     # Boltzmann's constant -- by default normalized
     KB = 1.0
+    # Lattice sweeps between full recomputations of the incrementally tracked observables, 
+    # each recomputation being itself a full lattice pass
+    RESYNC_SWEEPS = 100
+    # Single spin steps whose random numbers are drawn at once
+    RNG_BATCH = 65_536
+    # Side of the tiles in the tiled update, 64 x 64 int8 spins (4 KiB) fit in the L1 cache
+    TILE_SIZE = 64
+    # Sub-sweeps performed within each tile before moving on to the next one
+    TILE_SUBSWEEPS = 1
+    # Maximum number of frames written to the GIF, longer runs are strided
+    MAX_GIF_FRAMES = 200
+    # Minimum length, in pixels, of the longest side of the GIF frames
+    GIF_SIZE = 400
+    # Minimum length, in pixels, of the shortest side of the GIF frames, so 1D chains stay visible
+    GIF_MIN_SIDE = GIF_SIZE // 10
     
-    def __init__(self, dim: Tuple[int, int], coupling: float, temp: float, ext_field: float):
+    def __init__(self, dim: Tuple[int, ...], coupling: float, temp: float, ext_field: float, seed: Optional[int] = None):
         """Creates an object representing a sheet of metal. 
 
         Args:
-            dim (Tuple[int, int]): dimensions of the metallic sheet, can be 1D or 2D
+            dim (Tuple[int, ...]): dimensions of the metallic sheet, can be 1D (a chain) or 2D
             coupling (float): coupling interaction between spins
-            temp (float): the solid's temperature (in Kelvin)
+            temp (float): the solid's temperature (in Kelvin), 0 runs a zero-temperature quench
             ext_field (float): external magnetic field strength
+            seed (Optional[int], optional): seed for the random number generator. Defaults to None.
         """
-        self.spins = np.zeros(shape=(dim))
-        self.reset_spins()
+        if len(dim) not in (1, 2):
+            raise ValueError("The metal must be either 1D or 2D")
+        # Random number generator (PCG64)
+        self._rng = np.random.default_rng(seed)
+        # Spins are stored as int8 (+1 / -1), which keeps the lattice compact in memory
+        self.spins = np.zeros(shape=(dim), dtype=np.int8)
+        # Scratch buffer for the energy calc, avoiding a temporary lattice on every measurement
+        self._tmp = np.empty_like(self.spins)
+        # Flat indices of the black and white sites of the checkerboard decomposition; every neighbor 
+        # of a black site is white
+        black_sites = np.indices(self.spins.shape).sum(axis=0) % 2 == 0
+        self._sublattices = (np.flatnonzero(black_sites), np.flatnonzero(~black_sites))
         self.coupling = coupling
         self.temperature = temp
         self.external_field = ext_field
+        self.reset_spins()
         
-    def run_simulation(self, steps: int = 1_000) -> None:
+    @property
+    def temperature(self) -> float:
+        """float: the solid's temperature (in Kelvin)"""
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, temp: float) -> None:
+        if temp < 0:
+            raise ValueError("The temperature can't be negative")
+        self._temperature = temp
+        # Inverse temperature, cached since every acceptance probability needs it; infinite at T = 0
+        self._beta = math.inf if temp == 0 else 1.0 / (IsingMetal.KB * temp)
+
+    def run_simulation(self, steps: int = 1_000, method: str = "metropolis") -> None:
         """Evolves the system's state over a certain amount of time and animates the spins as a heatmap.
 
         Args:
             steps (int, optional): Total simulation time. Defaults to 1_000.
+            method (str, optional): update scheme, either "metropolis" (one step is a single spin 
+            flip attempt), "checkerboard", "multispin" or "tiled" (one step is a whole lattice sweep). 
+            Defaults to "metropolis".
         """
-        import matplotlib.animation as animation
+        from PIL import Image
+
+        if steps < 1:
+            raise ValueError("At least one step is needed")
+
+        # Selects the update scheme
+        if method == "metropolis":
+            evolve = self._evolve_state
+        elif method == "checkerboard":
+            if any(length % 2 for length in self.spins.shape):
+                raise ValueError("The checkerboard update requires even lattice dimensions")
+            evolve = self._checkerboard_sweep
+        elif method == "tiled":
+            evolve = self._tiled_sweep
+        elif method == "multispin":
+            if self.spins.ndim != 2:
+                raise ValueError("The multi-spin update requires a 2D lattice")
+            rows, cols = self.spins.shape
+            if rows % 2 or cols % (2 * _WORD_BITS):
+                raise ValueError("The multi-spin update requires an even number of rows and columns multiple of 128")
+            if self.coupling < 0 or self.external_field != 0:
+                raise ValueError("The multi-spin update requires a ferromagnetic coupling and no external field")
+            evolve = self._multispin_sweep
+        else:
+            raise ValueError(f"Unknown update method: {method}")
 
-        # Steps array for data register and loop making
-        steps_arr = np.arange(steps)
-        # Stores the spins through time
-        spins_evolution = []
         # Regulates the "interval" of each data registering / "photography"; 
         # Smaller intervals generate finer details but larger data quantity
         # and slower code. 
         photo_interval = 100
+        # Stores the spins through time as differences between registers, see _record_snapshot
+        initial_spins = self.spins.copy()
+        last_frame = initial_spins.copy()
+        snapshots = []
 
+        # Measurements are tracked incrementally from here on
+        self._sync_observables()
 
-        # Main simulation loop
-        for step in steps_arr:
-            self._evolve_state()
-            
-            # Data registering
-            if step % photo_interval == 0:
-                # Store a copy to avoid referencing the same array
-                spins_evolution.append(self.spins.copy())
+        # Data file, kept open and buffered through the whole simulation
+        filename = f"ising_data_c={self.coupling:.2f}_t={self.temperature:.2f}_h={self.external_field:.2f}.dat"
+        self._data_file = open(filename, "a", buffering=1 << 20)
+
+        # Main simulation loop, evolved in chunks of photo_interval steps between registers
+        try:
+            for step in range(0, steps, photo_interval):
+                # Data registering
+                self._record_snapshot(snapshots, last_frame)
                 
-                data = f"{step}    {self._calc_energy()}   {self._calc_magnetization()}\n"
+                data = f"{step}    {self._energy}   {self._spin_sum / self.spins.size}\n"
                 self._register_data(data)
 
-        # Animation setup
-        fig, ax = plt.subplots()
-        im = ax.imshow(spins_evolution[0], cmap='coolwarm', vmin=-1, vmax=1, origin='lower')
-        ax.set_title("Ising Model Spin Evolution")
+                evolve(min(photo_interval, steps - step))
+        finally:
+            self._data_file.close()
 
-        def update(frame):
-            im.set_data(spins_evolution[frame])
-            ax.set_xlabel(f"Step: {frame * photo_interval}")
-            return [im]
+        # Animation setup, encoded straight with Pillow from at most MAX_GIF_FRAMES strided frames
+        stride = max(1, -(-len(snapshots) // IsingMetal.MAX_GIF_FRAMES))
+        cmap = colormaps["coolwarm"]
+        rows, cols = self._as_rows(self.spins).shape
+        scale = max(1, -(-IsingMetal.GIF_SIZE // max(rows, cols)))
+        # Each axis gets at least GIF_MIN_SIDE pixels, stretching thin lattices
+        row_scale = max(scale, -(-IsingMetal.GIF_MIN_SIDE // rows))
+        col_scale = max(scale, -(-IsingMetal.GIF_MIN_SIDE // cols))
+
+        def render(frame: np.ndarray) -> "Image.Image":
+            # Maps the spins to RGB once; flipped so the first row sits at the bottom
+            rgb = cmap((np.flipud(self._as_rows(frame)) + 1) / 2, bytes=True)[..., :3]
+            return Image.fromarray(rgb).resize((cols * col_scale, rows * row_scale), Image.NEAREST)
+
+        spins_evolution = itertools.islice(IsingMetal._replay_snapshots(initial_spins, snapshots), 0, None, stride)
+        frames = (render(frame) for frame in spins_evolution)
+        first_frame = next(frames)
+        first_frame.save("ising_animation.gif", save_all=True, append_images=frames, duration=20, loop=0)
+
+    def run_parallel(self, n_chains: int, steps: int = 1_000) -> Tuple[float, float]:
+        """Evolves independent Metropolis-Hastings chains in parallel, starting from random configurations.
+
+        The metal's own spins are left untouched.
+
+        Args:
+            n_chains (int): number of independent chains
+            steps (int, optional): spin flip attempts per chain. Defaults to 1_000.
+
+        Returns:
+            Tuple[float, float]: the final energy and magnetization, averaged over the chains
+        """
+        if n_chains < 1:
+            raise ValueError("At least one chain is needed")
+
+        rows, cols = self._as_rows(self.spins).shape
+        spins_stack = self._rng.choice(np.array([-1, 1], dtype=np.int8), (n_chains, rows, cols))
+        acceptance = self._acceptance_table()
+
+        # Independent random streams, one per chain, drawn from within the parallel region
+        rngs = self._rng.spawn(n_chains)
+        _metropolis_chains(spins_stack, self.spins.ndim == 2, self.coupling, self.external_field, acceptance, 
+                           rngs, steps, IsingMetal.RNG_BATCH)
+
+        # Averages the observables over the chains, each in the metal's own shape
+        spins_stack = spins_stack.reshape((n_chains,) + self.spins.shape)
+        avg_energy = np.mean([self._calc_energy(spins) for spins in spins_stack])
+        avg_magnetization = np.mean([self._calc_magnetization(spins) for spins in spins_stack])
+        return float(avg_energy), float(avg_magnetization)
 
-        ani = animation.FuncAnimation(
-            fig, update, frames=len(spins_evolution), interval=20, blit=True, repeat=False
-        )
-        
-        ani.save(filename="ising_animation.gif")
-        
     def reset_spins(self) -> None:
         """Resets the spins to a default, random, configuration."""
-        self.spins = np.random.choice([-1, 1], self.spins.shape)
+        self.spins = self._rng.choice(np.array([-1, 1], dtype=np.int8), self.spins.shape)
+        self._sync_observables()
+
+    @staticmethod
+    def _as_rows(spins: np.ndarray) -> np.ndarray:
+        """Auxiliar function to view a lattice as 2D, where a 1D chain is a single row.
+
+        Args:
+            spins (np.ndarray): 1D or 2D lattice
+
+        Returns:
+            np.ndarray: 2D view sharing the lattice memory
+        """
+        return spins if spins.ndim == 2 else spins.reshape(1, -1)
+
+    def _sync_observables(self) -> None:
+        """Recomputes from scratch the incrementally tracked energy and spins sum."""
+        self._energy = self._calc_energy()
+        self._spin_sum = int(self.spins.sum())
+        self._unsynced_steps = 0
         
+    def _record_snapshot(self, snapshots: List[Tuple[bool, np.ndarray]], last_frame: np.ndarray) -> None:
+        """Auxiliar function to store the current spins as their difference to the last stored frame.
+
+        Sparse differences are stored as the flat indices of the flipped spins, dense ones as a 
+        full copy of the spins, whichever is smaller. Each snapshot is tagged as (is_full, array).
+
+        Args:
+            snapshots (List[Tuple[bool, np.ndarray]]): stored snapshots, appended in place
+            last_frame (np.ndarray): spins at the last snapshot, updated in place
+        """
+        flipped = np.flatnonzero(self.spins != last_frame)
+        if flipped.nbytes < self.spins.nbytes:
+            snapshots.append((False, flipped))
+        else:
+            snapshots.append((True, self.spins.copy()))
+        last_frame[...] = self.spins
+
+    @staticmethod
+    def _replay_snapshots(initial_spins: np.ndarray, 
+                          snapshots: List[Tuple[bool, np.ndarray]]) -> Iterator[np.ndarray]:
+        """Auxiliar function to lazily rebuild the spins at each snapshot stored by _record_snapshot.
+
+        Args:
+            initial_spins (np.ndarray): spins before the first snapshot
+            snapshots (List[Tuple[bool, np.ndarray]]): stored snapshots
+
+        Yields:
+            np.ndarray: the spins at each snapshot; the same array is reused between snapshots
+        """
+        frame = initial_spins.copy()
+        for is_full, snapshot in snapshots:
+            if is_full:
+                frame[...] = snapshot
+            else:
+                frame.flat[snapshot] *= -1
+            yield frame
+
     def _register_data(self, data: str):
         """Auxiliar function for measurement registering into a file.
 
         Args:
             data (str): measurements taken and formatted, ready for storage.
         """
-        # Filename formatting 
-        filename = f"ising_data_c={self.coupling:.2f}_t={self.temperature:.2f}_h={self.external_field:.2f}.dat"
-        # File output
-        with open(filename, "a+") as f:
-            f.write(data)
+        # Buffered file output, the file is opened and closed by run_simulation
+        self._data_file.write(data)
         
-    def _calc_magnetization(self) -> float:
+    def _calc_magnetization(self, spins: Optional[np.ndarray] = None) -> float:
         """Auxiliar function to measure the metal's magnetization (spins arithmetic avg)
 
+        Args:
+            spins (Optional[np.ndarray], optional): lattice to measure. Defaults to the metal's spins.
+
         Returns:
             float: average spin
         """
-        avg_spin = np.average(self.spins)
+        spins = self.spins if spins is None else spins
+        avg_spin = np.average(spins)
         return avg_spin
         
-    def _calc_energy(self) -> float:
+    def _calc_energy(self, spins: Optional[np.ndarray] = None) -> float:
         """Auxiliar function to measure the current state energy (computes the hamiltonian).
 
+        Args:
+            spins (Optional[np.ndarray], optional): lattice to measure. Defaults to the metal's spins.
+
         Returns:
             float: the current state energy
         """
         # Computes the neighbor interaction factor 
-        neigh_interac = self._calc_neighbor_interaction()
+        neigh_interac = self._calc_neighbor_interaction(spins)
         # Computes the external interaction factor
-        extfield_interac = self._calc_extfield_interaction()
+        extfield_interac = self._calc_extfield_interaction(spins)
         
         # Computes total energy 
         total_energy = -1.0 * self.coupling * neigh_interac - extfield_interac
         return total_energy
         
-    def _calc_neighbor_interaction(self) -> float:
+    def _calc_neighbor_interaction(self, spins: Optional[np.ndarray] = None) -> float:
         """Computes the neighbor interaction factor for the total energy calc. 
 
+        Args:
+            spins (Optional[np.ndarray], optional): lattice to measure. Defaults to the metal's spins.
+
         Returns:
             float: Neighboring spins interaction energy
         """
-        neigh_interac_hor = 0
-        neigh_interac_ver = 0
-        
-        # Stores the rows and cols for condensed loop typing
-        rows = self.spins.shape[0]
-        cols = self.spins.shape[1]
-            
-        # Traverses all spins
-        # Note: the modulo induces a periodic boundary condition
-        for i in range(0, rows):
-            for j in range(0, cols):
-                # Calcs the interaction between spins in the same row
-                neigh_interac_hor += self.spins[i][j] * self.spins[i][(j + 1) % cols]
-                # Calcs the interaction between spins in the same column
-                neigh_interac_ver += self.spins[i][j] * self.spins[(i + 1) % rows][j]
-
-        neigh_interac = neigh_interac_hor + neigh_interac_ver
-        return neigh_interac
+        spins = self.spins if spins is None else spins
+        tmp = self._tmp
+        neigh_interac = 0
+
+        # Calcs the interaction between neighboring spins along each axis, with slice views 
+        # instead of shifted copies
+        # Note: the last spin pairing with the first one induces a periodic boundary condition
+        for axis in range(spins.ndim):
+            # Selects every spin along the preceding axes
+            lead = (slice(None),) * axis
+            bulk, shifted = lead + (slice(None, -1),), lead + (slice(1, None),)
+            last, first = lead + (slice(-1, None),), lead + (slice(0, 1),)
+
+            np.multiply(spins[bulk], spins[shifted], out=tmp[bulk])
+            np.multiply(spins[last], spins[first], out=tmp[last])
+            neigh_interac += tmp.sum()
+
+        return float(neigh_interac)
     
-    def _calc_extfield_interaction(self) -> float:
+    def _calc_extfield_interaction(self, spins: Optional[np.ndarray] = None) -> float:
         """Computes the external magnetic field interaction factor for the total energy calc.
 
+        Args:
+            spins (Optional[np.ndarray], optional): lattice to measure. Defaults to the metal's spins.
+
         Returns:
             float: External field interaction
         """
-                
-        ext_field_interac = np.sum(self.external_field * self.spins)
+        spins = self.spins if spins is None else spins
+        # Note: sums the spins first, so no float temporary the size of the lattice is allocated
+        ext_field_interac = self.external_field * float(spins.sum())
             
         return ext_field_interac
     
-    def _evolve_state(self) -> None:
-        """Evolves the system to the next state with a Metropolis-Hastings algorithm."""
-        
-        # Picks a random spin
-        random_spin_row, random_spin_col = np.random.randint(0, self.spins.shape[0]), np.random.randint(0, self.spins.shape[1])
-    
-        # Computes the energy difference if that spin is flipped
-        dE = self._calc_dE(random_spin_row, random_spin_col)
-        
-        # If the energy is lower, accept the flip 
-        if dE <= 0:
-            self._flip_spin((random_spin_row, random_spin_col))
-            
-        # If the energy is higher, accepts the flip with a probability proportional to temperature
-        else:
-            prob_accept = np.exp(-dE / (IsingMetal.KB * self.temperature))
-            if np.random.random() < prob_accept:
-                self._flip_spin((random_spin_row, random_spin_col))
+    def _acceptance_table(self) -> np.ndarray:
+        """Precomputes the Metropolis flip acceptance probabilities, min(1, exp(-dE / (KB * T))).
 
-        
-    def _calc_dE(self, spin_row: int, spin_col: int) -> float:
-        """Computes the difference in energy generated by a spin flip
+        With nearest-neighbor interactions dE only takes a handful of values, so the table is indexed 
+        by [(spin + 1) // 2, (nn_sum + 4) // 2], where nn_sum is the chosen spin's neighbors sum.
+
+        Returns:
+            np.ndarray: (2, 5) table of acceptance probabilities
+        """
+        spin = np.array([[-1], [1]])
+        nn_sum = np.arange(-4, 5, 2)
+
+        dE = 2.0 * self.coupling * spin * nn_sum + 2.0 * self.external_field * spin
+
+        # Lower energies are always accepted; only rising ones enter the exponent, so that at T = 0 
+        # (infinite beta) they get a probability of 0 instead of the NaN from 0 * inf
+        exponent = np.multiply(-dE, self._beta, out=np.zeros_like(dE), where=dE > 0)
+        return np.exp(exponent)
+
+    def _evolve_state(self, n_steps: int = 1) -> None:
+        """Evolves the system through the next states with a Metropolis-Hastings algorithm.
 
         Args:
-            spin_row (int): spin's row coordinate
-            spin_col (int): spin's col coordinate
+            n_steps (int, optional): number of spin flip attempts. Defaults to 1.
+        """
+        rows, cols = self._as_rows(self.spins).shape
+        acceptance = self._acceptance_table()
 
-        Returns:
-            float: energy diff
+        for start in range(0, n_steps, IsingMetal.RNG_BATCH):
+            # Draws the batch's random spins and acceptance uniforms at once
+            batch = min(IsingMetal.RNG_BATCH, n_steps - start)
+            rows_idx = self._rng.integers(0, rows, size=batch)
+            cols_idx = self._rng.integers(0, cols, size=batch)
+            uniforms = self._rng.random(batch)
+
+            self._run_steps(acceptance, rows_idx, cols_idx, uniforms)
+
+    def _tiled_sweep(self, n_sweeps: int = 1) -> None:
+        """Evolves the system through whole lattice sweeps, visiting the lattice tile by tile.
+
+        The lattice is split in TILE_SIZE x TILE_SIZE tiles, and each one receives TILE_SUBSWEEPS 
+        sub-sweeps of random single spin Metropolis-Hastings steps before moving on to the next, 
+        so the steps keep hitting spins already in cache on large lattices.
+
+        Args:
+            n_sweeps (int, optional): number of lattice sweeps. Defaults to 1.
         """
-        rows, cols = self.spins.shape
-        
-        # Selects the chosen spin's value
-        chosen_spin = self.spins[spin_row, spin_col]
-        
-        # Nearest-neighbors sum
-        nn_sum = np.sum([
-            self.spins[(spin_row + 1) % rows, spin_col],
-            self.spins[(spin_row - 1) % rows, spin_col],
-            self.spins[spin_row, (spin_col + 1) % cols],
-            self.spins[spin_row, (spin_col - 1) % cols]
-        ])
-        
-        # Computes the energy diff 
-        dE = 2.0 * self.coupling * chosen_spin * nn_sum + 2.0 * self.external_field * chosen_spin
-        return dE
-        
-    def _flip_spin(self, spin_pos: Tuple[int, int]) -> None:
-        """Auxiliar function to flip a certain spin's value given its position.
+        rows, cols = self._as_rows(self.spins).shape
+        tile = IsingMetal.TILE_SIZE
+        acceptance = self._acceptance_table()
+
+        # Tiles along a band of rows, where the last one may be narrower
+        tile_cols = np.arange(0, cols, tile)
+        tile_widths = np.minimum(tile, cols - tile_cols)
+
+        for _ in range(n_sweeps):
+            # Draws the random numbers one band of tiles at a time
+            for band_row in range(0, rows, tile):
+                band_height = min(tile, rows - band_row)
+                steps_per_tile = IsingMetal.TILE_SUBSWEEPS * band_height * tile_widths
+                batch = int(steps_per_tile.sum())
+
+                # Random spins within each tile, with the tiles visited in order
+                # Note: a scalar bound draws several times faster, so the per-step widths are only 
+                # used when the last tile is narrower
+                first_col = np.repeat(tile_cols, steps_per_tile)
+                width = tile if cols % tile == 0 else np.repeat(tile_widths, steps_per_tile)
+                rows_idx = band_row + self._rng.integers(0, band_height, size=batch)
+                cols_idx = first_col + self._rng.integers(0, width, size=batch)
+                uniforms = self._rng.random(batch)
+
+                self._run_steps(acceptance, rows_idx, cols_idx, uniforms)
+
+    def _run_steps(self, acceptance: np.ndarray, rows_idx: np.ndarray, cols_idx: np.ndarray,
+                   uniforms: np.ndarray) -> None:
+        """Auxiliar function to run a batch of single spin steps on the Metropolis kernel.
+
+        Args:
+            acceptance (np.ndarray): flip acceptance probabilities, see _acceptance_table
+            rows_idx (np.ndarray): row of the spin picked at each step
+            cols_idx (np.ndarray): col of the spin picked at each step
+            uniforms (np.ndarray): uniform [0, 1) draws for each step's acceptance
+        """
+        energy_change, spin_sum_change = _metropolis_steps(
+            self._as_rows(self.spins), self.spins.ndim == 2, self.coupling, self.external_field, 
+            acceptance, rows_idx, cols_idx, uniforms
+        )
+
+        # Updates the measurements from the accepted flips only, periodically resyncing to avoid drift
+        self._energy += energy_change
+        self._spin_sum += spin_sum_change
+        self._unsynced_steps += uniforms.shape[0]
+        if self._unsynced_steps >= IsingMetal.RESYNC_SWEEPS * self.spins.size:
+            self._sync_observables()
+
+    def _checkerboard_sweep(self, n_sweeps: int = 1) -> None:
+        """Evolves the system through whole lattice sweeps with a checkerboard Metropolis-Hastings algorithm.
+
+        Each sweep updates all black sites at once and then all white sites, which is equivalent 
+        to single-spin Metropolis for nearest-neighbor interactions since sites of the same color 
+        never interact. Runs on the native kernel from ising_kernel.c when it's built.
 
         Args:
-            spin_position (int): tuple with the position of the to-be-flipped spin.
+            n_sweeps (int, optional): number of lattice sweeps. Defaults to 1.
         """
-        self.spins[spin_pos[0], spin_pos[1]] *= -1
\ No newline at end of file
+        acceptance = self._acceptance_table()
+
+        if _native_kernel is not None and self.spins.ndim == 2:
+            rows, cols = self.spins.shape
+            # Acceptance probabilities scaled to the uint32 range, for the strict integer comparison in C; 
+            # the top value stands for a probability of 1, which the kernel always accepts
+            thresholds = np.minimum(np.round(acceptance * 2.0 ** 32), 2 ** 32 - 1).astype(np.uint32)
+
+            for _ in range(n_sweeps):
+                draws = self._rng.integers(0, 2 ** 32, size=self.spins.shape, dtype=np.uint32)
+                _native_kernel.sweep_checkerboard(self.spins, rows, cols, thresholds, draws)
+
+            self._sync_observables()
+            return
+
+        for _ in range(n_sweeps):
+            for sublattice in self._sublattices:
+                # Nearest-neighbors sum for every site
+                # Note: np.roll wraps around the edges, which induces a periodic boundary condition
+                nn_sum = sum(np.roll(self.spins, shift, axis=axis) 
+                             for axis in range(self.spins.ndim) for shift in (1, -1))
+
+                # Looks up the flip acceptance probabilities, drawing only for the sites being updated
+                # Note: flat integer indices gather faster than a boolean mask
+                flat_spins = self.spins.reshape(-1)
+                prob_accept = acceptance[(flat_spins[sublattice] + 1) // 2, (nn_sum.reshape(-1)[sublattice] + 4) // 2]
+                accept = self._rng.random(prob_accept.shape) < prob_accept
+
+                flat_spins[sublattice[accept]] *= -1
+
+        # A sweep touches the whole lattice anyway, so the measurements are simply recomputed
+        self._sync_observables()
+
+    def _multispin_sweep(self, n_sweeps: int = 1) -> None:
+        """Evolves the system through whole lattice sweeps with a multi-spin coded Metropolis-Hastings algorithm.
+
+        The lattice is packed 64 spins per uint64 word and updated with bitwise operations, in a 
+        checkerboard pattern over the words. Only supports a ferromagnetic coupling and no external 
+        field, where a flip is always accepted unless 3 or 4 neighbors are aligned with the spin.
+
+        Args:
+            n_sweeps (int, optional): number of lattice sweeps. Defaults to 1.
+        """
+        # Acceptance probabilities of an up spin with 4 (dE = 8J) and 3 (dE = 4J) aligned neighbors
+        acceptance = self._acceptance_table()
+        prob_eq4 = acceptance[1, 4]
+        prob_eq3 = acceptance[1, 3]
+
+        bits = _pack_spins(self.spins)
+        black_words = np.indices(bits.shape).sum(axis=0) % 2 == 0
+
+        for _ in range(n_sweeps):
+            for sublattice in (black_words, ~black_words):
+                # Neighbor words; horizontally, the words at the row edges are offset by one bit
+                # Note: np.roll and the bit rotations induce a periodic boundary condition
+                up = np.roll(bits, 1, axis=0)
+                down = np.roll(bits, -1, axis=0)
+                left = np.roll(bits, 1, axis=1)
+                left[:, 0] = (bits[:, -1] << np.uint64(1)) | (bits[:, -1] >> np.uint64(_WORD_BITS - 1))
+                right = np.roll(bits, -1, axis=1)
+                right[:, -1] = (bits[:, 0] >> np.uint64(1)) | (bits[:, 0] << np.uint64(_WORD_BITS - 1))
+
+                # Bits set where each neighbor is aligned with the spin
+                up ^= ~bits
+                down ^= ~bits
+                left ^= ~bits
+                right ^= ~bits
+
+                # Counts the aligned neighbors bitwise, as two half adders
+                vertical_both, vertical_one = up & down, up ^ down
+                horizontal_both, horizontal_one = left & right, left ^ right
+                eq4 = vertical_both & horizontal_both
+                eq3 = (vertical_both & horizontal_one) | (horizontal_both & vertical_one)
+
+                # Flips with the Boltzmann probability when the energy rises, always otherwise; 
+                # random bits are only drawn for the words being updated
+                eq4, eq3 = eq4[sublattice], eq3[sublattice]
+                flip = ((eq4 & _random_bits(self._rng, prob_eq4, eq4.shape)) 
+                        | (eq3 & _random_bits(self._rng, prob_eq3, eq3.shape)) 
+                        | ~(eq4 | eq3))
+                bits[sublattice] ^= flip
+
+        self.spins[...] = _unpack_spins(bits)
+        self._sync_observables()
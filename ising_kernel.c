@@ -0,0 +1,126 @@
+/*
+ * Optional native checkerboard Metropolis-Hastings kernel for Ising.py.
+ *
+ * Ising.py loads it through ctypes when the shared library sits next to it:
+ *
+ *     cc -O3 -shared -fPIC ising_kernel.c -o ising_kernel.so
+ *
+ * That portable build is plain scalar code. Adding -march=native uses AVX2 when the building
+ * CPU supports it, but the resulting library then only runs on CPUs with AVX2.
+ *
+ * Spins are int8 (+1 / -1), row-major, with periodic boundary conditions. Acceptance is
+ * decided with integers: a flip is accepted when rnd < thresholds[idx], or always when
+ * thresholds[idx] == UINT32_MAX, where idx = 5 * (spin > 0) + (nn_sum + 4) / 2 and thresholds 
+ * holds the acceptance probabilities scaled to the uint32 range (see IsingMetal._acceptance_table).
+ * A probability of 0 is therefore never accepted, and one of 1 always is.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+/* Updates the sites of a given color in columns [j_start, j_stop) of row i, one at a time. */
+static void update_sites(int8_t *spins, int rows, int cols, int i, int j_start, int j_stop, int color,
+                         const uint32_t *thresholds, const uint32_t *rnd)
+{
+    const int8_t *row_up = spins + (size_t)(i == 0 ? rows - 1 : i - 1) * cols;
+    const int8_t *row_down = spins + (size_t)(i == rows - 1 ? 0 : i + 1) * cols;
+    int8_t *row = spins + (size_t)i * cols;
+    const uint32_t *rnd_row = rnd + (size_t)i * cols;
+
+    /* First column of the given color */
+    int j = j_start + ((i + j_start + color) & 1);
+
+    for (; j < j_stop; j += 2) {
+        int left = (j == 0) ? cols - 1 : j - 1;
+        int right = (j == cols - 1) ? 0 : j + 1;
+        int8_t s = row[j];
+        int nn_sum = row_up[j] + row_down[j] + row[left] + row[right];
+        int idx = 5 * (s > 0) + (nn_sum + 4) / 2;
+
+        /* Branchless flip: s ^ 0xFE turns +1 into -1 and back, applied only when accepted */
+        uint32_t threshold = thresholds[idx];
+        int accept = (threshold == UINT32_MAX) | (rnd_row[j] < threshold);
+        row[j] = (int8_t)(s ^ (-accept & 0xFE));
+    }
+}
+
+#ifdef __AVX2__
+/* Updates the sites of a given color among columns [j, j + 32) of a row, which must not touch the row edges. */
+static void update_block_avx2(int8_t *row, const int8_t *row_up, const int8_t *row_down, int j,
+                              __m256i color_mask, const uint32_t *thresholds, const uint32_t *rnd_row)
+{
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i ones = _mm256_set1_epi8(-1);
+    __m256i s = _mm256_loadu_si256((const __m256i *)(row + j));
+
+    /* Neighbors sum, in [-4, 4] so it fits the int8 lanes */
+    __m256i nn_sum = _mm256_add_epi8(
+        _mm256_add_epi8(_mm256_loadu_si256((const __m256i *)(row_up + j)),
+                        _mm256_loadu_si256((const __m256i *)(row_down + j))),
+        _mm256_add_epi8(_mm256_loadu_si256((const __m256i *)(row + j - 1)),
+                        _mm256_loadu_si256((const __m256i *)(row + j + 1))));
+
+    /* Table index 5 * (s > 0) + (nn_sum + 4) / 2; nn_sum + 4 is even, so the 16-bit shift never
+     * carries a bit into the neighboring byte */
+    __m256i idx = _mm256_srli_epi16(_mm256_add_epi8(nn_sum, _mm256_set1_epi8(4)), 1);
+    idx = _mm256_add_epi8(idx, _mm256_and_si256(_mm256_cmpgt_epi8(s, zero), _mm256_set1_epi8(5)));
+
+    /* Acceptance, 8 sites at a time in 32-bit lanes: rnd < threshold, compared unsigned, or a
+     * threshold of UINT32_MAX */
+    __m128i idx_lo = _mm256_castsi256_si128(idx);
+    __m128i idx_hi = _mm256_extracti128_si256(idx, 1);
+    __m128i idx_parts[4] = {idx_lo, _mm_srli_si128(idx_lo, 8), idx_hi, _mm_srli_si128(idx_hi, 8)};
+    __m256i accept[4];
+
+    for (int k = 0; k < 4; k++) {
+        __m256i threshold = _mm256_i32gather_epi32((const int *)thresholds, _mm256_cvtepu8_epi32(idx_parts[k]), 4);
+        __m256i draw = _mm256_loadu_si256((const __m256i *)(rnd_row + j + 8 * k));
+        __m256i reject = _mm256_cmpeq_epi32(_mm256_max_epu32(draw, threshold), draw);
+        reject = _mm256_andnot_si256(_mm256_cmpeq_epi32(threshold, ones), reject);
+        accept[k] = _mm256_xor_si256(reject, ones);
+    }
+
+    /* Packs the 32-bit masks back into bytes; the packs work per 128-bit lane, hence the permutation */
+    __m256i accept_mask = _mm256_packs_epi16(_mm256_packs_epi32(accept[0], accept[1]),
+                                             _mm256_packs_epi32(accept[2], accept[3]));
+    accept_mask = _mm256_permutevar8x32_epi32(accept_mask, _mm256_setr_epi32(0, 4, 1, 5, 2, 6, 3, 7));
+
+    /* Flips the accepted sites of the given color: s ^ 0xFE turns +1 into -1 and back */
+    __m256i flip = _mm256_and_si256(_mm256_and_si256(accept_mask, color_mask), _mm256_set1_epi8(-2));
+    _mm256_storeu_si256((__m256i *)(row + j), _mm256_xor_si256(s, flip));
+}
+#endif
+
+/*
+ * Performs one checkerboard sweep in place: all black sites ((i + j) even), then all white sites.
+ *
+ * rnd holds one uniform uint32 draw per site, in the same layout as spins.
+ */
+void sweep_checkerboard(int8_t *spins, int rows, int cols, const uint32_t *thresholds, const uint32_t *rnd)
+{
+    for (int color = 0; color < 2; color++) {
+        for (int i = 0; i < rows; i++) {
+#ifdef __AVX2__
+            const int8_t *row_up = spins + (size_t)(i == 0 ? rows - 1 : i - 1) * cols;
+            const int8_t *row_down = spins + (size_t)(i == rows - 1 ? 0 : i + 1) * cols;
+            const __m256i even_lanes = _mm256_set1_epi16(0x00FF);
+            int j = 1;
+
+            /* The first and last columns wrap around, so they are left to the scalar loop */
+            update_sites(spins, rows, cols, i, 0, 1, color, thresholds, rnd);
+            for (; j + 33 <= cols; j += 32) {
+                __m256i color_mask = ((i + j + color) & 1) ? _mm256_andnot_si256(even_lanes, _mm256_set1_epi8(-1))
+                                                           : even_lanes;
+                update_block_avx2(spins + (size_t)i * cols, row_up, row_down, j, color_mask, thresholds,
+                                  rnd + (size_t)i * cols);
+            }
+            update_sites(spins, rows, cols, i, j, cols, color, thresholds, rnd);
+#else
+            update_sites(spins, rows, cols, i, 0, cols, color, thresholds, rnd);
+#endif
+        }
+    }
+}